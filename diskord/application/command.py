@@ -24,7 +24,7 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
-from typing import Callable, Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Callable, Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 import asyncio
 import logging
 import traceback
@@ -33,7 +33,7 @@ from ..utils import get as utils_get
 from ..application_commands import ApplicationCommandMixin
 from ..errors import ApplicationCommandError, _BaseCommandError, Forbidden
 from ..enums import OptionType, ApplicationCommandType, try_enum
-from .mixins import ChecksMixin
+from .mixins import ChecksMixin, OptionsMixin, _ItemList
 from .types import Check
 from .permissions import ApplicationCommandPermissions
 
@@ -45,6 +45,9 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+_SUB_COMMAND = OptionType.sub_command.value
+_SUB_COMMAND_GROUP = OptionType.sub_command_group.value
+
 class ApplicationCommand(ApplicationCommandMixin, ChecksMixin):
     """Represents an application command.
 
@@ -91,19 +94,49 @@ class ApplicationCommand(ApplicationCommandMixin, ChecksMixin):
         For more info on checks and how to register them, See :func:`~ext.commands.check`
         documentation as these checks actually come from there.
     """
+    __slots__ = (
+        '_callback',
+        '_guild_ids',
+        '_description',
+        '_name',
+        '_default_permission',
+        '_cog',
+        '_cog_check',
+        '_bot_check',
+        '_cached_dict',
+        '_state',
+        '_id',
+        '_application_id',
+        '_guild_id',
+        '_version',
+        '_type',
+        '_type_value',
+        'extras',
+        'permissions',
+        'checks',
+        # commands are user constructed and users may set their own attributes.
+        '__dict__',
+    )
+
     _type: ApplicationCommandType
+    _type_value: int
 
     def __init__(self, callback: Callable, **attrs: Any):
         self._callback = callback
         self._guild_ids = attrs.pop("guild_ids", None)
-        self._description = (
-            attrs.pop("description", callback.__doc__) or "No description"
-        )
+        description = attrs.pop("description", None)
+        if description is None:
+            description = callback.__doc__
+
+        self._description = description or "No description"
         self._name = attrs.pop("name", callback.__name__)
         self._default_permission = attrs.pop("default_permission", True)
         self.extras: Dict[str, Any] = attrs.pop("extras", {})
 
         self._cog = None
+        self._cog_check: Tuple[Any, Optional[Check]] = (None, None)
+        self._bot_check: Tuple[Any, Optional[Callable[..., Any]]] = (None, None)
+        self._cached_dict: Optional[dict] = None
         self._state = None # type: ignore
 
         self._id: Optional[int]
@@ -117,29 +150,33 @@ class ApplicationCommand(ApplicationCommandMixin, ChecksMixin):
         self._version: Optional[int] = None
         self._update_callback_data()
 
+    def _invalidate_cache(self) -> None:
+        self._cached_dict = None
+
+    def _from_data(self, data: ApplicationCommandPayload) -> ApplicationCommand:
+        if not self._is_current(data):
+            # name, description and default permission can be updated from the API data.
+            self._cached_dict = None
+        return super()._from_data(data)
+
     def is_global_command(self) -> bool:
         """:class:`bool`: Whether the command is global command or not."""
         return (not self._guild_ids)
 
     def _update_callback_data(self):
         self.permissions: List[ApplicationCommandPermissions] = []
-        try:
-            permissions = self.callback.__application_command_permissions__
-        except AttributeError:
-            permissions = {}  # type: ignore
+        permissions = getattr(self.callback, "__application_command_permissions__", None)
 
-        for guild in permissions:
-            perms = ApplicationCommandPermissions(command=self, guild_id=guild)
-            perms.overwrites = permissions[guild]
+        if permissions:
+            for guild, overwrites in permissions.items():
+                perms = ApplicationCommandPermissions(command=self, guild_id=guild)
+                perms.overwrites = overwrites
+                self.permissions.append(perms)
 
-            self.permissions.append(perms)
-
-        self.checks: List[Check]
-        try:
-            self.checks = self.callback.__commands_checks__
-            self.checks.reverse()
-        except AttributeError:
-            self.checks = []
+        # the list on callback is copied rather than reversed in place so
+        # re-processing the same callback doesn't flip the order again.
+        checks = getattr(self.callback, "__commands_checks__", None)
+        self.checks: List[Check] = checks[::-1] if checks else []
 
     @property
     def _client(self):
@@ -155,14 +192,19 @@ class ApplicationCommand(ApplicationCommandMixin, ChecksMixin):
     @callback.setter
     def callback(self, value) -> None:
         self._callback = value
+        self._invalidate_cache()
 
-        if not hasattr(value, "__application_command_params__"):
+        params = getattr(value, "__application_command_params__", None)
+        if params is None:
             value.__application_command_params__ = {}
 
-        self._options = []
-
-        for opt in value.__application_command_params__.values():
-            self.append_option(opt) # type: ignore
+        # only slash commands have options, context menus just swap the callback.
+        if isinstance(self, OptionsMixin):
+            self._options = _ItemList(self._options_changed)
+            self._options_by_name = {}
+            if params:
+                for opt in params.values():
+                    self.append_option(opt)
 
         self._update_callback_data()
 
@@ -214,9 +256,8 @@ class ApplicationCommand(ApplicationCommandMixin, ChecksMixin):
         :class:`~application.ApplicationCommandPermissions`
             The permissions that were added.
         """
-        original = self.get_permissions(guild_id)
-        if original:
-            self.remove_permissions(guild_id)
+        # no-op if there are no permissions for this guild yet.
+        self.remove_permissions(guild_id)
 
         permission = ApplicationCommandPermissions(command=self, guild_id=guild_id)
         self.permissions.append(permission)
@@ -292,11 +333,10 @@ class ApplicationCommandStore:
 
         command._state = self._state
 
-        if not hasattr(command.callback, "__application_command_params__"):
-            command.callback.__application_command_params__ = {}
-
-        for opt in command.callback.__application_command_params__.values():
-            command.append_option(opt) # type: ignore
+        params = getattr(command.callback, "__application_command_params__", None)
+        if params:
+            for opt in params.values():
+                command.append_option(opt) # type: ignore
 
         if command.id is not None:
             self.add_application_command(command)
@@ -349,12 +389,13 @@ class ApplicationCommandStore:
             return
 
         for option in interaction.data['options']:
-            if option['type'] == OptionType.sub_command.value:
-                command = command.get_child(name=option['name']) # type: ignore
-            elif option['type'] == OptionType.sub_command_group.value:
-                grp = command.get_child(name=option['name'])
+            option_type = option['type']
+            if option_type == _SUB_COMMAND:
+                command = command._get_child_fast(option['name']) # type: ignore
+            elif option_type == _SUB_COMMAND_GROUP:
+                grp = command._get_child_fast(option['name'])
                 # first element is the command being used.
-                command = grp.get_child(name=option['options'][0]['name']) # type: ignore
+                command = grp._get_child_fast(option['options'][0]['name']) # type: ignore
 
         choices = await command.resolve_autocomplete_choices(interaction)
         await interaction.response.autocomplete(choices)
@@ -366,6 +407,48 @@ class ApplicationCommandStore:
             name=f"discord-application-command-autocomplete-dispatch-{interaction.data['id']}", # type: ignore
         )
 
+    def _bulk_upsert_guild_commands(self, application_id: int, guilds: Dict[int, List[dict]]) -> asyncio.Future:
+        # every guild has its own bulk upsert so they are all sent concurrently
+        # rather than waiting for one guild before starting the next.
+        return asyncio.gather(
+            *(
+                self._state.http.bulk_upsert_guild_commands(application_id, guild, commands)
+                for guild, commands in guilds.items()
+            ),
+            return_exceptions=True,
+        )
+
+    def _add_upserted_commands(self, cmds: List[ApplicationCommandPayload]) -> None:
+        for cmd in cmds:
+            command = utils_get(
+                self._pending,
+                name=cmd["name"],
+                type=try_enum(ApplicationCommandType, int(cmd["type"])), # type: ignore
+            )
+            self.add_application_command(command._from_data(cmd))
+            self.remove_pending_command(command) # type: ignore
+
+    def _add_upserted_guild_commands(self, guild_ids: List[int], results: List[Any]) -> Optional[BaseException]:
+        # the commands of guilds that were upserted successfully are already registered
+        # on Discord so they are still added even if other guilds failed, every failure
+        # is logged and the first one is returned for the caller to raise.
+        error = None
+        for guild_id, cmds in zip(guild_ids, results):
+            if isinstance(cmds, Forbidden):
+                # the bot is missing application.commands scope so cannot
+                # make the command in the guild
+                traceback.print_exception(type(cmds), cmds, cmds.__traceback__)
+                continue
+            if isinstance(cmds, BaseException):
+                _log.error("Failed to register the application commands of guild %s.", guild_id, exc_info=cmds)
+                if error is None:
+                    error = cmds
+                continue
+
+            self._add_upserted_commands(cmds)
+
+        return error
+
     async def sync_application_commands(self, *, delete_unregistered_commands: bool = True):
 
         _log.info("Synchronizing internal cache commands.")
@@ -400,14 +483,30 @@ class ApplicationCommandStore:
 
 
         # Deleting the command that weren't created.
-        if delete_unregistered_commands:
-            for command in non_registered:
-                if command.get("guild_id"):
-                    await self._state.http.delete_guild_command(
-                        client.user.id, command["guild_id"], command["id"]
-                    )
-                else:
-                    await self._state.http.delete_global_command(client.user.id, command["id"])
+        if delete_unregistered_commands and non_registered:
+            http = self._state.http
+            # the deletions don't depend on each other so they are sent concurrently,
+            # the HTTP client still takes care of the rate limits.
+            results = await asyncio.gather(
+                *(
+                    http.delete_guild_command(client.user.id, command["guild_id"], command["id"])
+                    if command.get("guild_id") else
+                    http.delete_global_command(client.user.id, command["id"])
+                    for command in non_registered
+                ),
+                return_exceptions=True,
+            )
+
+            # every deletion is waited for and each failure logged before raising the first one.
+            error = None
+            for command, result in zip(non_registered, results):
+                if isinstance(result, BaseException):
+                    _log.error("Failed to delete the unregistered application command %s.", command["id"], exc_info=result)
+                    if error is None:
+                        error = result
+
+            if error is not None:
+                raise error
 
         # Registering the remaining commands
 
@@ -425,25 +524,10 @@ class ApplicationCommandStore:
 
                 guilds[guild].append(command.to_dict())
 
-        for guild in guilds:
-            try:
-                cmds = await self._state.http.bulk_upsert_guild_commands(
-                    client.user.id, guild, guilds[guild]
-                )
-            except Forbidden as e:
-                # the bot is missing application.commands scope so cannot
-                # make the command in the guild
-                traceback.print_exc()
-                continue
-            else:
-                for cmd in cmds:
-                    command = utils_get(
-                        self._pending,
-                        name=cmd["name"],
-                        type=try_enum(ApplicationCommandType, int(cmd["type"])), # type: ignore
-                    )
-                    self.add_application_command(command._from_data(cmd))
-                    self.remove_pending_command(command) # type: ignore
+        results = await self._bulk_upsert_guild_commands(client.user.id, guilds)
+        error = self._add_upserted_guild_commands(list(guilds), results)
+        if error is not None:
+            raise error
 
         # now time for rest of global commands that are
         # new. at this point, self._pending should only have *new* *global*
@@ -476,17 +560,6 @@ class ApplicationCommandStore:
             data = command.to_dict()
             commands.append(data)
 
-        cmds = await self._state.http.bulk_upsert_global_commands(client.user.id, commands)
-
-        for cmd in cmds:
-            command = utils_get(
-                self._pending,
-                name=cmd["name"],
-                type=try_enum(ApplicationCommandType, int(cmd["type"])), # type: ignore
-            )
-            self.add_application_command(command._from_data(cmd))
-            self.remove_pending_command(command) # type: ignore
-
         # Registering the guild commands now
 
         guilds = {}
@@ -499,21 +572,24 @@ class ApplicationCommandStore:
 
                 guilds[guild].append(data)
 
-        for guild in guilds:
-            try:
-                cmds = await self._state.http.bulk_upsert_guild_commands(
-                    client.user.id, guild, guilds[guild]
-                )
-            except Forbidden as e:
-                # bot doesn't has application.commands scope
-                traceback.print_exc()
-                continue
-            else:
-                for cmd in cmds:
-                    command = utils_get(
-                        self._pending,
-                        name=cmd["name"],
-                        type=try_enum(ApplicationCommandType, int(cmd["type"])), # type: ignore
-                    )
-                    self.add_application_command(command._from_data(cmd))
-                    self.remove_pending_command(command) # type: ignore
\ No newline at end of file
+        # the global and per-guild bulk upserts are independent so they are all sent
+        # at once, the responses are then applied with the global commands first.
+        cmds, results = await asyncio.gather(
+            self._state.http.bulk_upsert_global_commands(client.user.id, commands),
+            self._bulk_upsert_guild_commands(client.user.id, guilds),
+            return_exceptions=True,
+        )
+
+        error = None
+        if isinstance(cmds, BaseException):
+            # the guild commands are still added below as they were registered.
+            _log.error("Failed to register the global application commands.", exc_info=cmds)
+            error = cmds
+        else:
+            self._add_upserted_commands(cmds)
+
+        guild_error = self._add_upserted_guild_commands(list(guilds), results)
+        if error is None:
+            error = guild_error
+        if error is not None:
+            raise error
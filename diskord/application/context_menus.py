@@ -24,7 +24,7 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
-from typing import Callable, Any, List, TYPE_CHECKING
+from typing import Callable, Any, TYPE_CHECKING
 import inspect
 
 from ..enums import ApplicationCommandType
@@ -33,6 +33,7 @@ from ..user import User
 from ..message import Message
 
 from .command import ApplicationCommand
+from .mixins import _copy_payload
 
 if TYPE_CHECKING:
     from ..interactions import InteractionContext
@@ -48,6 +49,12 @@ __all__ = (
 class ContextMenuCommand(ApplicationCommand):
     """Represents a context menu command."""
 
+    __slots__ = ()
+
+    # builds the target (user or message) the command was used on, implemented
+    # by each command type.
+    _resolve_target: Callable[[InteractionContext], Any]
+
     # This class is intentionally not documented
 
     def __init__(self, callback: Callable[..., Any], **attrs: Any):
@@ -55,11 +62,46 @@ class ContextMenuCommand(ApplicationCommand):
         self._description = ""
 
     def to_dict(self) -> dict:
-        return {
-            "name": self._name,
-            "description": self._description,
-            "type": self._type.value,
-        }
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "name": self._name,
+                "description": self._description,
+                "type": self._type_value,
+            }
+        return _copy_payload(self._cached_dict)
+
+    async def invoke(self, context: InteractionContext):
+        """|coro|
+
+        Invokes the context menu command with provided invocation context.
+
+        Parameters
+        ----------
+        context: :class:`InteractionContext`
+            The interaction invocation context.
+        """
+        context.command = self
+        interaction: Interaction = context.interaction
+
+        interaction_type = interaction.data.get('type')  # type: ignore
+        if not interaction_type == self._type_value:
+            raise TypeError(
+                f'interaction type does not matches the command type. Interaction type is {interaction_type} and command type is {self.type}'
+            )
+
+        # the target is stored on the interaction so invoking again with the
+        # same interaction doesn't construct it again.
+        target = interaction._resolved_target
+        if target is None:
+            target = interaction._resolved_target = self._resolve_target(context)
+
+        self._client.dispatch('application_command', context)
+
+        cog = self.cog
+        if cog is not None:
+            await self.callback(cog, context, target)
+        else:
+            await self.callback(context, target)
 
 
 class UserCommand(ContextMenuCommand):
@@ -74,8 +116,11 @@ class UserCommand(ContextMenuCommand):
     In this class, The ``type`` attribute will always be :attr:`ApplicationCommandType.user`
     """
 
+    __slots__ = ()
+
     def __init__(self, callback, **attrs):
         self._type = ApplicationCommandType.user
+        self._type_value = self._type.value
         super().__init__(callback, **attrs)
 
     async def invoke(self, context: InteractionContext):
@@ -88,38 +133,27 @@ class UserCommand(ContextMenuCommand):
         context: :class:`InteractionContext`
             The interaction invocation context.
         """
-        context.command = self
-        interaction: Interaction = context.interaction
-        args: List[Any] = [context]
-        data: Any = interaction.data
-
-        if not interaction.data.get('type') == self.type.value:
-            raise TypeError(
-                f'interaction type does not matches the command type. Interaction type is {interaction.data["type"]} and command type is {self.type}' # type: ignore
-            )
+        await super().invoke(context)
 
+    def _resolve_target(self, context: InteractionContext) -> Any:
+        interaction = context.interaction
+        data: Any = interaction.data
         resolved = data["resolved"]
-        if interaction.guild:
-            member_with_user = resolved["members"][data["target_id"]]
-            member_with_user["user"] = resolved["users"][data["target_id"]]
-            user = Member(
+        target_id = data["target_id"]
+        user_data = resolved["users"][target_id]
+        guild = interaction.guild
+        if guild is not None:
+            member_with_user = {**resolved["members"][target_id], "user": user_data}
+            return Member(
                 data=member_with_user,
-                guild=interaction.guild,
-                state=interaction.guild._state,
-            )
-        else:
-            user = User(
-                state=context.client._connection,
-                data=resolved["users"][data["target_id"]],
+                guild=guild,
+                state=guild._state,
             )
 
-        args.append(user)
-
-        if context.command.cog is not None:
-            args.insert(0, context.command.cog)
-
-        self._client.dispatch('application_command', context)
-        await context.command.callback(*args)
+        return User(
+            state=context.client._connection,
+            data=user_data,
+        )
 
 
 class MessageCommand(ContextMenuCommand):
@@ -134,8 +168,11 @@ class MessageCommand(ContextMenuCommand):
     In this class, The ``type`` attribute will always be :attr:`ApplicationCommandType.message`
     """
 
+    __slots__ = ()
+
     def __init__(self, callback, **attrs):
         self._type = ApplicationCommandType.message
+        self._type_value = self._type.value
         super().__init__(callback, **attrs)
 
     async def invoke(self, context: InteractionContext):
@@ -148,39 +185,25 @@ class MessageCommand(ContextMenuCommand):
         context: :class:`InteractionContext`
             The interaction invocation context.
         """
-        context.command = self
-        interaction: Interaction = context.interaction
-        args: List[Any] = [context]
-        idata: Any = interaction.data
-
-        if not idata["type"] == self.type.value:
-            raise TypeError(
-                f'interaction type does not matches the command type. Interaction type is {interaction.data["type"]} and command type is {self.type}' # type: ignore
-            )
+        await super().invoke(context)
 
+    def _resolve_target(self, context: InteractionContext) -> Any:
+        interaction = context.interaction
+        idata: Any = interaction.data
         data = idata["resolved"]["messages"][idata["target_id"]]
-        if interaction.guild:
-            message = Message(
-                state=interaction.guild._state,
-                channel=interaction.channel, # type: ignore
-                data=data,
-            )
+        guild = interaction.guild
+        if guild is not None:
+            state = guild._state
+            channel = interaction.channel
         else:
-            message = Message(
-                state=context.client._connection,
-                channel=interaction.user, # type: ignore
-                data=data,
-            )
-
-        args.append(message)
-
-        if context.command.cog is not None:
-            args.insert(0, context.command.cog)
-
-        self._client.dispatch('application_command', context)
-        await context.command.callback(*args)
-
-
+            state = context.client._connection
+            channel = interaction.user
+
+        return Message(
+            state=state,
+            channel=channel, # type: ignore
+            data=data,
+        )
 
 
 def user_command(**options) -> Callable[..., Any]:
@@ -26,12 +26,16 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 from typing import (
     Any,
+    Dict,
     List,
     Optional,
+    Tuple,
     TYPE_CHECKING,
     Callable,
+    Iterable,
 )
-from ..utils import async_all, maybe_coroutine, get
+from inspect import isawaitable
+from ..utils import get
 from .types import Check
 from ..errors import ApplicationCommandCheckFailure
 
@@ -40,10 +44,69 @@ if TYPE_CHECKING:
     from .slash import SlashCommandChild, Option
 
 
+class _ItemList(list):
+    # A list that calls back its owner whenever it is changed in place, the
+    # owner uses it to rebuild its name index and drop the cached payload since
+    # the public properties hand these lists out to the users.
+    __slots__ = ('_changed',)
+
+    def __init__(self, changed: Callable[[], None], items: Iterable[Any] = ()):
+        super().__init__(items)
+        self._changed = changed
+
+
+def _notify_changed(name: str) -> Callable[..., Any]:
+    method = getattr(list, name)
+
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        ret = method(self, *args, **kwargs)
+        self._changed()
+        return ret
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in (
+    'append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse',
+    '__setitem__', '__delitem__', '__iadd__', '__imul__',
+):
+    setattr(_ItemList, _name, _notify_changed(_name))
+
+del _name
+
+
+def _index_by_name(items: Iterable[Any]) -> Dict[str, Any]:
+    # the first item registered with a name is the one name lookups return.
+    index: Dict[str, Any] = {}
+    for item in items:
+        index.setdefault(item._name, item)
+    return index
+
+
+def _copy_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    # Copies a cached payload so editing the returned payload doesn't corrupt
+    # the cache. Payloads only nest lists of payloads or of plain values.
+    ret = {}
+    for key, value in payload.items():
+        if isinstance(value, list):
+            value = [_copy_payload(item) if isinstance(item, dict) else item for item in value]
+        ret[key] = value
+    return ret
+
+
 class ChildrenMixin:
     """A mixin that implements children for slash commands or slash subcommand groups."""
+    __slots__ = ()
+
     _children: List[SlashCommandChild]
+    _children_by_name: Dict[str, SlashCommandChild]
     _options: List[Option]
+    _invalidate_cache: Callable[[], None]
+
+    def _children_changed(self) -> None:
+        self._children_by_name = _index_by_name(self._children)
+        self._invalidate_cache()
 
     @property
     def children(self) -> List[SlashCommandChild]:
@@ -63,8 +126,15 @@ class ChildrenMixin:
         Optional[:class:`SlashCommandChild`]
             The option that matched the traits. ``None`` if not found.
         """
+        if len(attrs) == 1 and 'name' in attrs:
+            return self._children_by_name.get(attrs['name'])
+
         return get(self._children, **attrs)
 
+    def _get_child_fast(self, name: str) -> Optional[SlashCommandChild]:
+        # used while dispatching interactions where the lookup is always by name.
+        return self._children_by_name.get(name)
+
     def add_child(self, child: SlashCommandChild) -> SlashCommandChild:
         """Adds a child to this command.
 
@@ -84,11 +154,10 @@ class ChildrenMixin:
         child._parent = self # type: ignore
         self._children.append(child)
 
-        if not hasattr(child.callback, "__application_command_params__"):
-            child.callback.__application_command_params__ = {}
-
-        for opt in child.callback.__application_command_params__.values():
-            child.append_option(opt)
+        if not child._callback_options_applied:
+            for opt in child._callback_options:
+                child.append_option(opt)
+            child._callback_options_applied = True
 
         # resetting the params so if user tries to re-add the command, the params
         # don't get duplicated.
@@ -111,7 +180,7 @@ class ChildrenMixin:
         Optional[:class:`SlashCommandChild`]
             The removed child. ``None`` if not found.
         """
-        child = get(self._children, **attrs)
+        child = self.get_child(**attrs)
         if child:
             self._children.remove(child)
 
@@ -120,7 +189,15 @@ class ChildrenMixin:
 
 class OptionsMixin:
     """A mixin that implements basic slash commands and subcommands options."""
+    __slots__ = ()
+
     _options: List[Option]
+    _options_by_name: Dict[str, Option]
+    _invalidate_cache: Callable[[], None]
+
+    def _options_changed(self) -> None:
+        self._options_by_name = _index_by_name(self._options)
+        self._invalidate_cache()
 
     @property
     def options(self):
@@ -141,8 +218,15 @@ class OptionsMixin:
         Optional[:class:`Option`]
             The option that matched the traits. ``None`` if not found.
         """
+        if len(attrs) == 1 and 'name' in attrs:
+            return self._options_by_name.get(attrs['name'])
+
         return get(self._options, **attrs)
 
+    def _get_option_fast(self, name: str) -> Optional[Option]:
+        # used while dispatching interactions where the lookup is always by name.
+        return self._options_by_name.get(name)
+
     def add_option(self, index: int = -1, **attrs: Any) -> Option:
         """Adds an option to command.
 
@@ -197,7 +281,7 @@ class OptionsMixin:
         Optional[:class:`Option`]
             The removed option. ``None`` if not found.
         """
-        option = get(self._options, **attrs)
+        option = self.get_option(**attrs)
         if option:
             self._options.remove(option)
 
@@ -206,7 +290,13 @@ class OptionsMixin:
 
 class ChecksMixin:
     """A mixin that implements checks for application commands."""
+    __slots__ = ()
+
     checks: List[Check]
+    # (cog, overridden cog_check of that cog)
+    _cog_check: Tuple[Any, Optional[Check]]
+    # (bot, the bot's can_run if it has one)
+    _bot_check: Tuple[Any, Optional[Callable[..., Any]]]
 
     def add_check(self, predicate: Check):
         """
@@ -265,17 +355,33 @@ class ChecksMixin:
         :class:`bool`
             A boolean indicating if the command can be invoked.
         """
-        if hasattr(ctx.bot, "can_run"):
-            if not await ctx.bot.can_run(ctx): # type: ignore
+        bot = ctx.bot
+        cached_bot, bot_can_run = self._bot_check
+        if cached_bot is not bot:
+            # plain clients don't have global checks, this is resolved once
+            # per client the command is invoked with.
+            bot_can_run = getattr(bot, "can_run", None)
+            self._bot_check = (bot, bot_can_run)
+
+        if bot_can_run is not None:
+            if not await bot_can_run(ctx):
                 raise ApplicationCommandCheckFailure(
                     f"The global check functions for command {self.name} failed." # type: ignore
                 )
 
         cog = self.cog # type: ignore
         if cog is not None:
-            local_check = type(cog)._get_overridden_method(cog.cog_check)
+            cached_cog, local_check = self._cog_check
+            if cached_cog is not cog:
+                # resolving the overridden method walks the cog's class so it is
+                # only done once per cog the command is bound to.
+                local_check = type(cog)._get_overridden_method(cog.cog_check)
+                self._cog_check = (cog, local_check)
+
             if local_check is not None:
-                ret = await maybe_coroutine(local_check, ctx)
+                ret = local_check(ctx)
+                if isawaitable(ret):
+                    ret = await ret
                 if not ret:
                     return False
 
@@ -284,4 +390,11 @@ class ChecksMixin:
             # since we have no checks, then we just return True.
             return True
 
-        return await async_all(predicate(ctx) for predicate in predicates)  # type: ignore
+        for predicate in predicates:
+            ret = predicate(ctx)
+            if isawaitable(ret):
+                ret = await ret
+            if not ret:
+                return False
+
+        return True
@@ -23,6 +23,7 @@ DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
 from typing import Optional, Callable, Any, TYPE_CHECKING
+from operator import methodcaller
 from ..enums import ApplicationCommandPermissionType
 
 if TYPE_CHECKING:
@@ -31,6 +32,10 @@ if TYPE_CHECKING:
 
 __all__ = ('ApplicationCommandPermissions', 'CommandPermissionOverwrite', 'permission')
 
+_to_dict = methodcaller('to_dict')
+_ROLE = ApplicationCommandPermissionType.role
+_USER = ApplicationCommandPermissionType.user
+
 class ApplicationCommandPermissions:
     """A class that allows you to define permissions for an application command
     in a :class:`Guild`.
@@ -47,6 +52,8 @@ class ApplicationCommandPermissions:
     overwrite: List[:class:`CommandPermissionOverwrite`]
         The overwrites this permissions set holds.
     """
+    __slots__ = ('command', 'guild_id', 'overwrites')
+
     def __init__(self, guild_id: int, command: ApplicationCommand = None):
         self.command  = command # type: ignore
         self.guild_id = guild_id
@@ -100,6 +107,10 @@ class ApplicationCommandPermissions:
             if overwrite.role_id == entity_id or overwrite.user_id == entity_id:
                 return self.overwrites.remove(overwrite)
 
+    def to_dict(self) -> dict:
+        # the overwrites cache their own payloads so this only collects them.
+        return {'permissions': list(map(_to_dict, self.overwrites))}
+
 class CommandPermissionOverwrite:
     """A class that defines an overwrite for :class:`ApplicationCommandPermissions`.
 
@@ -117,6 +128,8 @@ class CommandPermissionOverwrite:
     permission: :class:`bool`
         Whether to allow the command for provided user or role ID. Defaults to ``False``
     """
+    __slots__ = ('_role_id', '_user_id', '_permission', '_cached_dict', 'type')
+
     if TYPE_CHECKING:
         type: ApplicationCommandPermissionType
 
@@ -125,33 +138,68 @@ class CommandPermissionOverwrite:
         user_id: Optional[int] = None,
         permission: bool = False,
         ):
-        self.role_id = role_id
-        self.user_id = user_id
-        self.permission = permission
+        self._role_id = role_id
+        self._user_id = user_id
+        self._permission = True if permission else False
+        self._cached_dict: Optional[dict] = None
 
-        if self.role_id is not None and self.user_id is not None:
+        if self._role_id is not None and self._user_id is not None:
             raise TypeError('role_id and user_id cannot be mixed in permissions')
 
-        if self.role_id is not None:
-            self.type = ApplicationCommandPermissionType.role
+        if self._role_id is not None:
+            self.type = _ROLE
+
+        elif self._user_id is not None:
+            self.type = _USER
+
+    @property
+    def role_id(self) -> Optional[int]:
+        """Optional[:class:`int`]: The ID of role whose overwrite is being defined."""
+        return self._role_id
 
-        elif self.user_id is not None:
-            self.type = ApplicationCommandPermissionType.user
+    @role_id.setter
+    def role_id(self, value: Optional[int]) -> None:
+        self._role_id = value
+        self._cached_dict = None
 
+    @property
+    def user_id(self) -> Optional[int]:
+        """Optional[:class:`int`]: The ID of user whose overwrite is being defined."""
+        return self._user_id
+
+    @user_id.setter
+    def user_id(self, value: Optional[int]) -> None:
+        self._user_id = value
+        self._cached_dict = None
+
+    @property
+    def permission(self) -> bool:
+        """:class:`bool`: Whether the command is allowed for the user or role."""
+        return self._permission
+
+    @permission.setter
+    def permission(self, value: bool) -> None:
+        self._permission = True if value else False
+        self._cached_dict = None
 
     def _get_id(self) -> Optional[int]:
-        if self.type == ApplicationCommandPermissionType.user:
-            return self.user_id
+        if self.type is _USER:
+            return self._user_id
 
-        return self.role_id
+        return self._role_id
 
 
     def to_dict(self):
-        return {
-            'id': self._get_id(),
-            'type': self.type.value,
-            'permission': self.permission,
-        }
+        # the payload is sent for every guild the command is synced in so
+        # it is built once and reused until the overwrite is modified.
+        if self._cached_dict is None:
+            self._cached_dict = {
+                'id': self._get_id(),
+                'type': self.type.value,
+                'permission': self._permission,
+            }
+        # a copy is returned so editing the payload doesn't corrupt the cache.
+        return self._cached_dict.copy()
 
 
 def permission(*, guild_id: int, **options: Any):
@@ -170,17 +218,17 @@ def permission(*, guild_id: int, **options: Any):
     with ID ``12345``.
     """
 
-    def inner(func: Callable[..., Any]):
-        if not hasattr(func, "__application_command_permissions__"):
-            func.__application_command_permissions__ = {}
+    # the arguments are validated once when the decorator is created so a bad
+    # call fails immediately rather than when it is applied.
+    CommandPermissionOverwrite(**options)
 
-        for original_guild_id in func.__application_command_permissions__:
-            if original_guild_id == guild_id:
-                func.__application_command_permissions__[original_guild_id].append(CommandPermissionOverwrite(**options))
-                return func
+    def inner(func: Callable[..., Any]):
+        permissions = getattr(func, "__application_command_permissions__", None)
+        if permissions is None:
+            permissions = func.__application_command_permissions__ = {}
 
-        func.__application_command_permissions__[guild_id] = []
-        func.__application_command_permissions__[guild_id].append(CommandPermissionOverwrite(**options))
+        # every decorated command gets its own overwrite since overwrites are mutable.
+        permissions.setdefault(guild_id, []).append(CommandPermissionOverwrite(**options))
         return func
 
     return inner
\ No newline at end of file
@@ -24,21 +24,25 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
-from typing import Union, List, Callable, Any, Optional, TYPE_CHECKING
+from typing import Union, Dict, List, Callable, Any, Optional, Tuple, TYPE_CHECKING
+from operator import methodcaller
 import inspect
 
 from ..utils import unwrap_function, get_signature_parameters, get
-from ..enums import OptionType, ChannelType, ApplicationCommandType
+from ..enums import OptionType, ChannelType, ApplicationCommandType, _DATATYPE_OPTION_TYPES
 from ..member import Member
 from ..user import User
+from ..role import Role
+from ..abc import GuildChannel
 from ..errors import ApplicationCommandError, ApplicationCommandConversionError, ApplicationCommandCheckFailure
 from ..interactions import InteractionContext
 
 from .command import ApplicationCommand
-from .mixins import ChildrenMixin, OptionsMixin
+from .mixins import ChildrenMixin, OptionsMixin, _ItemList, _index_by_name, _copy_payload
 
 if TYPE_CHECKING:
     from ..application_commands import OptionChoice
+    from ..ext.commands import Converter
     from ..interactions import Interaction
     from ..types.interactions import (
         ApplicationCommandOptionChoice as ApplicationCommandOptionChoicePayload,
@@ -55,6 +59,34 @@ __all__ = (
     'slash_command'
 )
 
+_to_dict = methodcaller('to_dict')
+_to_payload = methodcaller('_payload')
+_EMPTY: Any = ()
+_SUB_COMMAND = OptionType.sub_command.value
+_SUB_COMMAND_GROUP = OptionType.sub_command_group.value
+_SUB_COMMAND_TYPES = frozenset({_SUB_COMMAND, _SUB_COMMAND_GROUP})
+
+
+def _flatten_channel_types(channel_types: List[Any]) -> List[ChannelType]:
+    # a list of channel types can be passed in place of a single type, e.g. the
+    # values of the annotation to channel types mapping.
+    flattened = []
+    for channel_type in channel_types:
+        if isinstance(channel_type, list):
+            flattened.extend(channel_type)
+        else:
+            flattened.append(channel_type)
+    return flattened
+
+# the builtin types plus the models that OptionType.from_datatype would otherwise
+# resolve by name, anything else falls back to from_datatype.
+_OPTION_TYPES: Dict[Any, OptionType] = {
+    **_DATATYPE_OPTION_TYPES,
+    User: OptionType.user,
+    Member: OptionType.user,
+    Role: OptionType.role,
+    GuildChannel: OptionType.channel,
+}
 
 
 class Option:
@@ -123,7 +155,30 @@ class Option:
         The minimum value the user can provide. If the :attr:`~Option.type` is
         :attr:`~OptionType.integer` or :attr:`~OptionType.number`
     """
+    __slots__ = (
+        '_name',
+        '_description',
+        '_required',
+        '_channel_types',
+        '_choices',
+        '_choices_by_name',
+        '_options',
+        '_options_by_name',
+        '_min_value',
+        '_max_value',
+        '_autocomplete',
+        '_cached_dict',
+        '_parent',
+        '_type',
+        '_type_value',
+        'arg',
+        '_converter',
+        '_convert',
+        'callback',
+    )
+
     _type: OptionType
+    _type_value: int
 
     def __init__(
         self,
@@ -143,30 +198,51 @@ class Option:
         self._name = name
         self._description = description or "No description"
         self._required = required
-        self._channel_types: List[ChannelType] = attrs.get("channel_types", [])  # type: ignore
-        self._choices: List[OptionChoice] = choices or []
-        self._options = []
+        # options without channel types, choices or sub-options share an empty
+        # tuple, the list is only created when they are actually set or accessed.
+        channel_types = attrs.get("channel_types")
+        self._channel_types: List[ChannelType] = (
+            _ItemList(self._invalidate_cache, _flatten_channel_types(channel_types)) if channel_types else _EMPTY
+        )
+        self._choices: List[OptionChoice] = _ItemList(self._choices_changed, choices) if choices else _EMPTY
+        self._choices_by_name: Dict[str, OptionChoice] = {}
+        self._options: List[Option] = _EMPTY
+        self._options_by_name: Dict[str, Option] = {}
         self._min_value = min_value
         self._max_value = max_value
-        self.autocomplete = autocomplete
+        self._autocomplete = autocomplete
+        self._cached_dict: Optional[dict] = None
 
-        if self._choices is None:
-            self._choices = []
+        for choice in self._choices:
+            choice._option = self
+        self._choices_by_name = _index_by_name(self._choices)
 
         self.arg = arg or self.name
-        self.converter: "Converter" = converter  # type: ignore
+        self.converter = converter
 
         self._parent: Union[ApplicationCommand, Option] = None  # type: ignore
+        # from_datatype reads the callback's signature for channel options
+        # so this has to be set before resolving the type.
+        self.callback: Callable[..., Any] = attrs.get("callback") # type: ignore
 
-        if type in [OptionType.sub_command_group, OptionType.sub_command]:
+        if isinstance(type, OptionType):
             self._type = type
         else:
             try:
-                self._type = OptionType.from_datatype(type, option=self)
+                resolved = _OPTION_TYPES.get(type)
             except TypeError:
-                self._type = type # type: ignore
+                # unhashable annotation, leave it to from_datatype.
+                resolved = None
 
-        self.callback: Callable[..., Any] = attrs.get("callback") # type: ignore
+            if resolved is not None:
+                self._type = resolved
+            else:
+                try:
+                    self._type = OptionType.from_datatype(type, option=self)
+                except TypeError:
+                    self._type = type # type: ignore
+
+        self._type_value = getattr(self._type, 'value', self._type)
 
     def __repr__(self):
         return f"<Option name={self._name!r} description={self._description!r}>"
@@ -174,7 +250,53 @@ class Option:
     def __str__(self):
         return self._name
 
+    def _invalidate_cache(self) -> None:
+        # the serialized payload of parent options (and ultimately the
+        # command) embeds this option's payload so they have to be rebuilt as well.
+        self._cached_dict = None
+        parent = self._parent
+        if parent is not None:
+            parent._invalidate_cache()
+
+    def _choices_changed(self) -> None:
+        # choices can be added to the list directly, they still need to know
+        # their option to keep the index in sync when renamed.
+        for choice in self._choices:
+            choice._option = self
+        self._choices_by_name = _index_by_name(self._choices)
+        self._invalidate_cache()
+
+    def _options_changed(self) -> None:
+        self._options_by_name = _index_by_name(self._options)
+        self._invalidate_cache()
+
     # properties
+    @property
+    def converter(self) -> "Converter": # type: ignore
+        """Optional[:class:`~ext.commands.Converter`]: The converter of this option."""
+        return self._converter
+
+    @converter.setter
+    def converter(self, value: "Converter") -> None: # type: ignore
+        self._converter = value
+        # a convert method that doesn't use the instance is resolved once, other
+        # converters are instantiated for every invocation as they may keep state.
+        convert = inspect.getattr_static(value, 'convert', None) if value is not None else None
+        if isinstance(convert, (staticmethod, classmethod)):
+            self._convert: Optional[Callable[..., Any]] = value.convert
+        else:
+            self._convert = None
+
+    @property
+    def autocomplete(self) -> Optional[Callable[..., Any]]:
+        """The function that would autocomplete this option if applicable."""
+        return self._autocomplete
+
+    @autocomplete.setter
+    def autocomplete(self, value: Optional[Callable[..., Any]]) -> None:
+        self._autocomplete = value
+        self._invalidate_cache()
+
     @property
     def name(self) -> str:
         """:class:`str`: The name of option."""
@@ -191,6 +313,9 @@ class Option:
             Discord's Enum work, For precise selection of channel types, Pass the list of
             desired :class:`ChannelType` in ``channel_types`` parameter in :class:`Option`
         """
+        if self._channel_types is _EMPTY:
+            self._channel_types = _ItemList(self._invalidate_cache)
+
         return self._channel_types
 
     @property
@@ -219,11 +344,17 @@ class Option:
     @property
     def choices(self) -> List[OptionChoice]:
         """List[:class:`OptionChoice`]: The list of choices of this option."""
+        if self._choices is _EMPTY:
+            self._choices = _ItemList(self._choices_changed)
+
         return self._choices
 
     @property
     def options(self) -> List[Option]:
         """List[:class:`Option`]: The list of sub-options of this option."""
+        if self._options is _EMPTY:
+            self._options = _ItemList(self._options_changed)
+
         return self._options
 
     @property
@@ -260,6 +391,9 @@ class Option:
         Optional[:class:`OptionChoice`]
             The removed choice. ``None`` if not found.
         """
+        if len(attrs) == 1 and 'name' in attrs:
+            return self._choices_by_name.get(attrs['name'])
+
         return get(self._choices, **attrs)
 
     def add_choice(self, index: int = -1, **attrs) -> OptionChoice:
@@ -284,7 +418,8 @@ class Option:
         from ..application_commands import OptionChoice
 
         choice = OptionChoice(**attrs)
-        self._choices.insert(index, choice)
+        choice._option = self
+        self.choices.insert(index, choice)
         return choice
 
     def append_choice(self, choice: OptionChoice) -> OptionChoice:
@@ -300,7 +435,8 @@ class Option:
         :class:`OptionChoice`
             The appended choice.
         """
-        self._choices.append(choice)
+        choice._option = self
+        self.choices.append(choice)
         return choice
 
     def remove_choice(self, **attrs: Any) -> Optional[OptionChoice]:
@@ -322,8 +458,9 @@ class Option:
         Optional[:class:`OptionChoice`]
             The removed choice. ``None`` if not found.
         """
-        choice = get(self._choices, **attrs)
+        choice = self.get_choice(**attrs)
         if choice:
+            choice._option = None
             self._choices.remove(choice)
 
         return choice
@@ -343,6 +480,9 @@ class Option:
         Optional[:class:`OptionChoice`]
             The option that matched the traits. ``None`` if not found.
         """
+        if len(attrs) == 1 and 'name' in attrs:
+            return self._options_by_name.get(attrs['name'])
+
         return get(self._options, **attrs)
 
     def add_option(self, index: int = -1, **attrs: Any) -> Option:
@@ -364,7 +504,7 @@ class Option:
         """
         option = Option(**attrs)
         option._parent = self
-        self._options.insert(index, option)
+        self.options.insert(index, option)
         return option
 
     def append_option(self, option: Option) -> Option:
@@ -381,7 +521,7 @@ class Option:
             The appended option.
         """
         option._parent = self
-        self._options.append(option)
+        self.options.append(option)
         return option
 
     def remove_option(self, **attrs: Any) -> Optional[Option]:
@@ -399,7 +539,7 @@ class Option:
         Optional[:class:`Option`]
             The removed choice. ``None`` if not found.
         """
-        option = get(self._options, **attrs)
+        option = self.get_option(**attrs)
         if option:
             self._options.remove(option)
 
@@ -407,46 +547,45 @@ class Option:
 
     def is_command_or_group(self) -> bool:
         """:class:`bool`: Indicates whether this option is a subcommand or subgroup."""
-        return self._type.value in (
-            OptionType.sub_command.value,
-            OptionType.sub_command_group.value,
-        )
+        return self._type_value in _SUB_COMMAND_TYPES
 
     def can_autocomplete(self) -> bool:
         """:class:`bool`: Indicates whether this option can autocomplete or not."""
-        return bool(self.autocomplete)
+        return bool(self._autocomplete)
+
+    def _payload(self) -> dict:
+        # the cached payload itself, parents embed it in their own payload.
+        if self._cached_dict is not None:
+            return self._cached_dict
 
-    def to_dict(self) -> dict:
         dict_ = {
-            "type": self._type.value,
+            "type": self._type_value,
             "name": self._name,
             "description": self._description,
-            "choices": [choice.to_dict() for choice in self._choices],
-            "options": [option.to_dict() for option in reversed(self.options)],
-            "autocomplete": self.can_autocomplete(),
+            "choices": list(map(_to_dict, self._choices)),
+            "options": list(map(_to_payload, reversed(self._options))),
+            "autocomplete": bool(self._autocomplete),
         }
 
-        if not self.is_command_or_group():
+        if self._type_value not in _SUB_COMMAND_TYPES:
             # Discord API doesn't allow passing required in the payload of
             # options that have type of 1 or 2.
             dict_["required"] = self._required
 
         if self._channel_types:
-            dict_["channel_types"] = []
-            for t in self._channel_types:
-                if isinstance(t, list):
-                    for st in t:
-                        dict_["channel_types"].append(st.value)
-                else:
-                    dict_["channel_types"].append(t.value)
+            dict_["channel_types"] = [ct.value for ct in _flatten_channel_types(self._channel_types)]
 
         if self._max_value:
-            dict_['max_value'] = self.max_value
+            dict_['max_value'] = self._max_value
         if self._min_value:
-            dict_['min_value'] = self.min_value
+            dict_['min_value'] = self._min_value
 
+        self._cached_dict = dict_
         return dict_
 
+    def to_dict(self) -> dict:
+        return _copy_payload(self._payload())
+
 
 class SlashCommand(ApplicationCommand, ChildrenMixin, OptionsMixin):
     """Represents a slash command.
@@ -474,10 +613,20 @@ class SlashCommand(ApplicationCommand, ChildrenMixin, OptionsMixin):
         The children of this commands i.e sub-commands and sub-command groups.
     """
 
+    __slots__ = (
+        '_options',
+        '_options_by_name',
+        '_children',
+        '_children_by_name',
+    )
+
     def __init__(self, callback, **attrs: Any):
         self._type: ApplicationCommandType = ApplicationCommandType.slash
-        self._options: List[Option] = []
-        self._children: List[SlashCommandChild] = []
+        self._type_value = self._type.value
+        self._options: List[Option] = _ItemList(self._options_changed)
+        self._options_by_name: Dict[str, Option] = {}
+        self._children: List[SlashCommandChild] = _ItemList(self._children_changed)
+        self._children_by_name: Dict[str, SlashCommandChild] = {}
 
         super().__init__(callback, **attrs)
 
@@ -486,65 +635,130 @@ class SlashCommand(ApplicationCommand, ChildrenMixin, OptionsMixin):
         """:class:`ApplicationCommandType`: The type of command. Always :attr:`ApplicatiionCommandType.slash`"""
         return self._type
 
-    async def _parse_option(
+    def _parse_option(
         self, interaction: Interaction, option: ApplicationCommandOptionPayload
     ) -> Any:
-        # This function isn't needed to be a coroutine function but it can be helpful in
-        # future so, yes that's the reason it's an async function.
-
-        if option["type"] in (
-            OptionType.string.value,
-            OptionType.integer.value,
-            OptionType.boolean.value,
-            OptionType.number.value,
-        ):
-            value = option["value"]
-
-        elif option["type"] == OptionType.user.value:
-            if interaction.guild:
-                value = interaction.guild.get_member(int(option["value"]))
-            else:
-                # self._client will not be None
-                value = self._client.get_user(int(option["value"]))
-
-            # value can be none in case when member intents are not available
-
-            if value is None:
-                resolved = interaction.data["resolved"]
-                if interaction.guild:
-                    member_with_user = resolved["members"][option["value"]]
-                    member_with_user["user"] = resolved["users"][option["value"]]
-                    value = Member(
-                        data=member_with_user,
-                        guild=interaction.guild,
-                        state=interaction.guild._state,
-                    )
-                else:
-                    value = User(
-                        state=self._state,
-                        data=resolved["users"][option["value"]],
-                    )
+        option_type = option["type"]
+
+        if option_type in _PRIMITIVE_OPTION_TYPES:
+            return option["value"]
 
-        elif option["type"] == OptionType.channel.value:
-            value = interaction.guild.get_channel(int(option["value"]))
+        try:
+            parser = _OPTION_PARSERS[option_type]
+        except KeyError:
+            # unknown option type, pass the raw value as-is.
+            return option["value"]
 
-        elif option["type"] == OptionType.role.value:
-            value = interaction.guild.get_role(int(option["value"]))
+        return parser(self, interaction, option)
 
-        elif option["type"] == OptionType.mentionable.value:
-            value = interaction.guild.get_member(
-                int(option["value"])
-            ) or interaction.guild.get_role(int(option["value"]))
+    def _parse_user_option(self, interaction: Interaction, option: ApplicationCommandOptionPayload) -> Any:
+        user_id = option["value"]
+        guild = interaction.guild
+
+        if guild:
+            value = guild.get_member(int(user_id))
+        else:
+            # self._client will not be None
+            value = self._client.get_user(int(user_id))
+
+        # value can be none in case when member intents are not available
+
+        if value is None:
+            resolved = interaction.data["resolved"]
+            user_data = resolved["users"][user_id]
+            if guild:
+                # build a new payload rather than writing the user into
+                # the resolved data sent by Discord.
+                member_with_user = {**resolved["members"][user_id], "user": user_data}
+                value = Member(
+                    data=member_with_user,
+                    guild=guild,
+                    state=guild._state,
+                )
+            else:
+                value = User(
+                    state=self._state,
+                    data=user_data,
+                )
 
         return value
 
-    async def _run_converter(self, converter, ctx, value):
+    def _parse_channel_option(self, interaction: Interaction, option: ApplicationCommandOptionPayload) -> Any:
+        return interaction.guild.get_channel(int(option["value"]))
+
+    def _parse_role_option(self, interaction: Interaction, option: ApplicationCommandOptionPayload) -> Any:
+        return interaction.guild.get_role(int(option["value"]))
+
+    def _parse_mentionable_option(self, interaction: Interaction, option: ApplicationCommandOptionPayload) -> Any:
+        entity_id = int(option["value"])
+        guild = interaction.guild
+        return guild.get_member(entity_id) or guild.get_role(entity_id)
+
+    async def _invoke_sub_command(self, context: InteractionContext, option: ApplicationCommandOptionPayload, kwargs: Dict[str, Any]) -> None:
+        # We will use the name to get the child because
+        # subcommands do not have any ID. They are essentially
+        # just options of a command. And option names are unique
+        subcommand = self._get_invoked_child(self, option["name"])
+        await self._invoke_child(context, subcommand, option.get("options", []), kwargs)
+
+    async def _invoke_sub_command_group(self, context: InteractionContext, option: ApplicationCommandOptionPayload, kwargs: Dict[str, Any]) -> None:
+        # In case of sub-command groups interactions, The options array
+        # only has one element which is the subcommand that is being used
+        # so we essentially just have to get the first element of the options
+        # list and lookup the callback function for name of that element to
+        # get the subcommand object.
+        subcommand_raw = option["options"][0]
+        group = self._get_invoked_child(self, option["name"])
+        subcommand = self._get_invoked_child(group, subcommand_raw["name"])
+        await self._invoke_child(context, subcommand, subcommand_raw.get("options", []), kwargs)
+
+    async def _invoke_child(self, context: InteractionContext, child: SlashCommandChild, options: List[ApplicationCommandOptionPayload], kwargs: Dict[str, Any]) -> None:
+        context.command = child
+
+        if not (await child.can_run(context)):
+            raise ApplicationCommandCheckFailure(
+                f"checks functions for application command {child._name} failed."
+            )
+
+        for sub_option in options:
+            await self._resolve_option(context, child, sub_option, kwargs)
+
+    async def _invoke_option(self, context: InteractionContext, option: ApplicationCommandOptionPayload, kwargs: Dict[str, Any]) -> None:
+        await self._resolve_option(context, self, option, kwargs)
+
+    def _get_invoked_child(self, command: SlashCommand, name: str) -> SlashCommandChild:
+        child = command._children_by_name.get(name)
+        if child is None:
+            raise ApplicationCommandError(
+                f"application command {command._name} has no sub-command named {name}."
+            )
+        return child
+
+    async def _resolve_option(self, context: InteractionContext, command: SlashCommand, option: ApplicationCommandOptionPayload, kwargs: Dict[str, Any]) -> None:
+        value = self._parse_option(context.interaction, option)
+        name = option["name"]
+        resolved = command._options_by_name.get(name)
+        if resolved is None:
+            # the command was changed after it was registered.
+            raise ApplicationCommandError(
+                f"application command {command._name} has no option named {name}."
+            )
+
+        if resolved._converter is not None:
+            value = await self._run_converter(resolved, context, value)
+
+        kwargs[resolved.arg] = value
+
+    async def _run_converter(self, option: Option, ctx, value):
         try:
-            converted = await converter().convert(ctx, value)
+            convert = option._convert
+            if convert is None:
+                convert = option._converter().convert  # type: ignore
+            converted = await convert(ctx, value)
         except Exception as error:
             if isinstance(error, ApplicationCommandError):
                 raise error
-            raise ApplicationCommandConversionError(converter, error) from error
+            raise ApplicationCommandConversionError(option.converter, error) from error
         else:
             return converted
 
@@ -565,27 +779,28 @@ class SlashCommand(ApplicationCommand, ChildrenMixin, OptionsMixin):
         options = data['options']
 
         for option in options:
-            if option['type'] == OptionType.sub_command.value:
-                command = self.get_child(name=option['name'])
+            option_type = option['type']
+            if option_type == _SUB_COMMAND:
+                command = self._get_child_fast(option['name'])
 
                 for sub in option['options']:
                     if 'focused' in sub:
                         option = sub
                         break
 
-            elif option['type'] == OptionType.sub_command_group.value:
-                if self.type == OptionType.sub_command:
+            elif option_type == _SUB_COMMAND_GROUP:
+                if self._type is OptionType.sub_command:
                     command = self
                 else:
-                    group = self.get_child(name=option['name'])
-                    command = group.get_child(name=option['options'][0]['name'])
+                    group = self._get_child_fast(option['name'])
+                    command = group._get_child_fast(option['options'][0]['name'])
 
                 for sub in option['options'][0]['options']:
                     if 'focused' in sub:
                         option = sub
                         break
 
-        resolved_option = self.get_option(name=option['name'])
+        resolved_option = self._get_option_fast(option['name'])
 
         if self.cog is not None:
             choices = await resolved_option.autocomplete(self.cog, option['value'], resolved_option, interaction)
@@ -610,99 +825,46 @@ class SlashCommand(ApplicationCommand, ChildrenMixin, OptionsMixin):
             The interaction invocation context.
         """
         interaction: Interaction = context.interaction
-        args = [context]
+        data = interaction.data
 
-        if not interaction.data["type"] == self.type.value:
+        interaction_type = data["type"]  # type: ignore
+        if not interaction_type == self._type_value:
             raise TypeError(
-                f'interaction type does not matches the command type. Interaction type is {interaction.data["type"]} and command type is {self.type}'
+                f'interaction type does not matches the command type. Interaction type is {interaction_type} and command type is {self.type}'
             )
 
-        options = interaction.data.get("options", [])
-        kwargs = {}
-
-        for option in options:
-            if option["type"] == OptionType.sub_command.value:
-                # We will use the name to get the child because
-                # subcommands do not have any ID. They are essentially
-                # just options of a command. And option names are unique
-
-                subcommand = self.get_child(name=option["name"])
-                context.command = subcommand
-
-                if not (await context.command.can_run(context)):
-                    raise ApplicationCommandCheckFailure(
-                        f"checks functions for application command {context.command._name} failed."
-                    )
-
-                sub_options = option.get("options", [])
-
-                for sub_option in sub_options:
-                    value = await self._parse_option(interaction, sub_option)
-                    resolved = subcommand.get_option(name=sub_option["name"])
-                    if resolved.converter is not None:
-                        converted = await self._run_converter(
-                            resolved.converter, context, value
-                        )
-                        kwargs[resolved.arg] = converted
-                    else:
-                        kwargs[resolved.arg] = value
-
-            elif option["type"] == OptionType.sub_command_group.value:
-                # In case of sub-command groups interactions, The options array
-                # only has one element which is the subcommand that is being used
-                # so we essentially just have to get the first element of the options
-                # list and lookup the callback function for name of that element to
-                # get the subcommand object.
-
-                subcommand_raw = option["options"][0]
-                group = self.get_child(name=option["name"])
-                subcommand = group.get_child(name=subcommand_raw["name"])
-                context.command = subcommand
-
-                if not (await context.command.can_run(context)):
-                    raise ApplicationCommandCheckFailure(
-                        f"checks functions for application command {context.command._name} failed."
-                    )
-
-                sub_options = subcommand_raw.get("options", [])
-
-                for sub_option in sub_options:
-                    value = await self._parse_option(interaction, sub_option)
-                    resolved = subcommand.get_option(name=sub_option["name"])
-
-                    if resolved.converter is not None:
-                        converted = await self._run_converter(
-                            resolved.converter, context, value
-                        )
-                        kwargs[resolved.arg] = converted
-                    else:
-                        kwargs[resolved.arg] = value
+        options = data.get("options")
+        kwargs: Optional[Dict[str, Any]] = None
 
-            else:
-                value = await self._parse_option(interaction, option)
-                resolved = self.get_option(name=option["name"])
-
-                if resolved.converter is not None:
-                    converted = await self._run_converter(
-                        resolved.converter, context, value
-                    )
-                    kwargs[resolved.arg] = converted
-                else:
-                    kwargs[resolved.arg] = value
+        if options:
+            kwargs = {}
+            for option in options:
+                handler = _INVOKE_HANDLERS.get(option["type"], _invoke_option)
+                await handler(self, context, option, kwargs)
 
-        if context.command is None:
-            context.command = self
+        # sub-commands set the context's command while resolving options.
+        command = context.command
+        if command is None:
+            command = context.command = self
 
-        if not (await context.command.can_run(context)):
+        if not (await command.can_run(context)):
             raise ApplicationCommandCheckFailure(
-                f"checks functions for application command {context.command._name} failed."
+                f"checks functions for application command {command._name} failed."
             )
 
-        if context.command.cog is not None:
-            args.insert(0, context.command.cog)
-
         self._client.dispatch('application_command', context)
-        await context.command.callback(*args, **kwargs)
+
+        callback = command.callback
+        cog = command.cog
+        if kwargs:
+            if cog is not None:
+                await callback(cog, context, **kwargs)
+            else:
+                await callback(context, **kwargs)
+        elif cog is not None:
+            await callback(cog, context)
+        else:
+            await callback(context)
 
     # decorators
 
@@ -759,20 +921,46 @@ class SlashCommand(ApplicationCommand, ChildrenMixin, OptionsMixin):
         return inner
 
     def to_dict(self) -> dict:
-        dict_ = {
-            "name": self._name,
-            "type": self._type.value,
-            "description": self._description,
-            "default_permission": self._default_permission,
-        }
-
-        if self.options:
-            dict_["options"] = [option.to_dict() for option in reversed(self.options)]
-        if self.children:
-            # commands with children cannot have options
-            dict_["options"] = [child.to_dict() for child in self.children]
-
-        return dict_
+        dict_ = self._cached_dict
+        if dict_ is None:
+            dict_ = {
+                "name": self._name,
+                "type": self._type_value,
+                "description": self._description,
+                "default_permission": self._default_permission,
+            }
+
+            if self._options:
+                dict_["options"] = [option._payload() for option in reversed(self._options)]
+            if self._children:
+                # commands with children cannot have options
+                dict_["options"] = [child._payload() for child in self._children]
+
+            self._cached_dict = dict_
+
+        return _copy_payload(dict_)
+
+
+# option types whose values are passed to the callback as-is.
+_PRIMITIVE_OPTION_TYPES = frozenset({
+    OptionType.string.value,
+    OptionType.integer.value,
+    OptionType.boolean.value,
+    OptionType.number.value,
+})
+
+_INVOKE_HANDLERS = {
+    _SUB_COMMAND: SlashCommand._invoke_sub_command,
+    _SUB_COMMAND_GROUP: SlashCommand._invoke_sub_command_group,
+}
+_invoke_option = SlashCommand._invoke_option
+
+_OPTION_PARSERS = {
+    OptionType.user.value: SlashCommand._parse_user_option,
+    OptionType.channel.value: SlashCommand._parse_channel_option,
+    OptionType.role.value: SlashCommand._parse_role_option,
+    OptionType.mentionable.value: SlashCommand._parse_mentionable_option,
+}
 
 
 class SlashCommandChild(SlashCommand):
@@ -789,38 +977,64 @@ class SlashCommandChild(SlashCommand):
     :class:`SlashSubCommand`.
     """
 
+    __slots__ = (
+        '_parent',
+        '_callback_options',
+        '_callback_options_applied',
+    )
+
     def __init__(self, *args: Any, **kwargs: Any):
-        super().__init__(*args, **kwargs)
         self._parent: SlashCommand = None  # type: ignore
+        super().__init__(*args, **kwargs)
+
+        # the options registered on callback are collected once here and applied
+        # only on the first add_child() so re-adding the child doesn't duplicate them.
+        params = getattr(self._callback, "__application_command_params__", None)
+        self._callback_options: Tuple[Option, ...] = tuple(params.values()) if params else ()
+        self._callback_options_applied: bool = False
 
     @property
     def guild_ids(self) -> List[int]:
         """List[:class:`int`]: Returns the list of guild IDs in which the parent command is registered."""
-        return self.parent.guild_ids
+        return self._parent.guild_ids
 
     @property
     def cog(self):
         """Optional[:class:`diskord.ext.commands.Cog`]: Returns the cog of the parent. If parent has no cog, Then None is returned."""
-        return self.parent.cog
+        return self._parent.cog
 
     @property
     def parent(self) -> SlashCommand:
         """:class:`SlashCommand`: The parent command of this child command."""
         return self._parent
 
-    def to_dict(self) -> dict:
-        ret = {
-            "name": self._name,
-            "description": self._description,
-            "type": self._type.value,
-        }
-        if self.options:
-            ret["options"] = [option.to_dict() for option in reversed(self.options)]
-        if self.children:
-            ret["options"] = [child.to_dict() for child in self.children]
+    def _invalidate_cache(self) -> None:
+        self._cached_dict = None
+        parent = self._parent
+        if parent is not None:
+            parent._invalidate_cache()
+
+    def _payload(self) -> dict:
+        # the cached payload itself, parents embed it in their own payload.
+        ret = self._cached_dict
+        if ret is None:
+            ret = {
+                "name": self._name,
+                "description": self._description,
+                "type": self._type_value,
+            }
+            if self._options:
+                ret["options"] = [option._payload() for option in reversed(self._options)]
+            if self._children:
+                ret["options"] = [child._payload() for child in self._children]
+
+            self._cached_dict = ret
 
         return ret
 
+    def to_dict(self) -> dict:
+        return _copy_payload(self._payload())
+
 
 class SlashCommandGroup(SlashCommandChild):
     """Represents a subcommand group of a slash command.
@@ -854,10 +1068,14 @@ class SlashCommandGroup(SlashCommandChild):
     also valid in this class.
     """
 
+    __slots__ = ()
+
     def __init__(self, callback: Callable, **attrs: Any):
         super().__init__(callback, **attrs)
         self._type = OptionType.sub_command_group
-        self._children: List[SlashCommandChild] = []
+        self._type_value = self._type.value
+        self._children: List[SlashCommandChild] = _ItemList(self._children_changed)
+        self._children_by_name: Dict[str, SlashCommandChild] = {}
 
     # decorators
 
@@ -912,9 +1130,12 @@ class SlashSubCommand(SlashCommandChild):
     also valid in this class.
     """
 
+    __slots__ = ()
+
     def __init__(self, callback: Callable, **attrs: Any):
         super().__init__(callback, **attrs)
         self._type = OptionType.sub_command
+        self._type_value = self._type.value
 
 
 def option(name: str, **attrs) -> Callable[..., Any]:
@@ -941,28 +1162,35 @@ def option(name: str, **attrs) -> Callable[..., Any]:
 
         arg = attrs.pop("arg", name)
 
-        if not hasattr(func, "__application_command_params__"):
-            func.__application_command_params__ = {}
+        options = getattr(func, "__application_command_params__", None)
+        if options is None:
+            func.__application_command_params__ = options = {}
 
-        unwrap = unwrap_function(func)
-        try:
-            globalns = unwrap.__globals__
-        except AttributeError:
-            globalns = {}
+        # the resolved signature is stored on the function so stacked option
+        # decorators don't resolve it again for every option.
+        params = getattr(func, "__application_command_signature__", None)
+        if params is None:
+            unwrap = unwrap_function(func)
+            try:
+                globalns = unwrap.__globals__
+            except AttributeError:
+                globalns = {}
+
+            params = get_signature_parameters(func, globalns)
+            func.__application_command_signature__ = params
 
-        params = get_signature_parameters(func, globalns)
         param = params.get(arg)
 
         required = attrs.pop("required", None)
         if required is None:
             required = param.default is inspect._empty
 
-        type = attrs.pop('type', params[arg].annotation)
+        type = attrs.pop('type', param.annotation)
 
         if type is inspect._empty:  # no annotations were passed.
             type = str
 
-        func.__application_command_params__[arg] = Option(
+        options[arg] = Option(
             name=name, type=type, arg=arg, required=required, callback=func, **attrs
         )
         return func
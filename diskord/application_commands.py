@@ -35,7 +35,6 @@ from typing import (
     Union,
 )
 
-from .utils import _get_as_snowflake
 from .enums import (
     ApplicationCommandType,
     ApplicationCommandPermissionType,
@@ -53,6 +52,7 @@ if TYPE_CHECKING:
     from .state import ConnectionState
     from .guild import Guild
     from .application.permissions import ApplicationCommandPermissions as ACP
+    from .application.slash import Option
 
 __all__ = (
     "ApplicationCommand",
@@ -138,16 +138,19 @@ class ApplicationCommandPermission:
 
 
 class ApplicationCommandMixin:
+    __slots__ = ()
+
     if TYPE_CHECKING:
         _state: ConnectionState
         _name: str
         _description: str
         _default_permission: bool
         _type: ApplicationCommandType
+        _type_value: int
 
     async def _edit_permissions(self, permissions: ACP):
         user = self._state._get_client().user
-        permissions_payload = {'permissions': [perm.to_dict() for perm in permissions.overwrites]}
+        permissions_payload = permissions.to_dict()
         permissions.command = self # type: ignore
 
         data = await self._state.http.edit_application_command_permissions(
@@ -249,15 +252,35 @@ class ApplicationCommandMixin:
 
         self._state._commands_store.remove_application_command(self.id)  # type: ignore
 
+    def _is_current(self, data: ApplicationCommandPayload) -> bool:
+        # Discord bumps the version on every update to a command so a payload
+        # with the same ID and version as the current state carries nothing new.
+        version = data.get("version")
+        if version is None or getattr(self, "_version", None) != int(version):
+            return False
+
+        return getattr(self, "_id", None) == int(data["id"])
+
     def _from_data(self, data: ApplicationCommandPayload):
-        self._id: Optional[int] = _get_as_snowflake(data, "id")
-        self._application_id: Optional[int] = _get_as_snowflake(data, "application_id")
-        self._guild_id: Optional[int] = _get_as_snowflake(data, "guild_id")
-        self._version: Optional[int] = _get_as_snowflake(data, "version")
-        self._default_permission = data.get("default_permission", getattr(self, "_default_permission", True))  # type: ignore
-        self._name = data.get("name", getattr(self, '_name', None))
-        self._description = data.get("description", getattr(self, '_description', None))
+        if self._is_current(data):
+            return self
+
+        # this runs for every command returned while syncing so the snowflake
+        # parsing is done inline instead of through _get_as_snowflake.
+        get = data.get
+        value = get("id")
+        self._id: Optional[int] = int(value) if value is not None else None
+        value = get("application_id")
+        self._application_id: Optional[int] = int(value) if value is not None else None
+        value = get("guild_id")
+        self._guild_id: Optional[int] = int(value) if value is not None else None
+        value = get("version")
+        self._version: Optional[int] = int(value) if value is not None else None
+        self._default_permission = get("default_permission", getattr(self, "_default_permission", True))  # type: ignore
+        self._name = get("name", getattr(self, '_name', None))
+        self._description = get("description", getattr(self, '_description', None))
         self._type = try_enum(ApplicationCommandType, int(data['type'])) # type: ignore
+        self._type_value = self._type.value
         return self
 
     @property
@@ -283,8 +306,9 @@ class ApplicationCommandMixin:
     @property
     def guild(self) -> Optional[Guild]:
         """:class:`Guild`: The guild this command belongs to. This could be ``None`` if command is a global command."""
-        if self._state:
-            return self._state._get_guild(self.guild_id)
+        state = self._state
+        if state:
+            return state._get_guild(self._guild_id)
 
     @property
     def type(self) -> ApplicationCommandType:
@@ -353,6 +377,19 @@ class ApplicationCommand(ApplicationCommandMixin):
     application_id: :class:`int`
         The ID of application this command belongs to.
     """
+    __slots__ = (
+        '_state',
+        '_id',
+        '_application_id',
+        '_guild_id',
+        '_version',
+        '_default_permission',
+        '_name',
+        '_description',
+        '_type',
+        '_type_value',
+    )
+
 
     def __init__(self, data: ApplicationCommandPayload, state: ConnectionState):
         self._state = state
@@ -371,6 +408,8 @@ class ApplicationSlashCommand(ApplicationCommand):
     options: :class:`ApplicationCommandOption`
         The options that belong to this command. (including subcommands or groups.)
     """
+    __slots__ = ('_options',)
+
     def __init__(self, data: ApplicationCommandPayload, state: ConnectionState):
         self._options: List[ApplicationCommandOption] = [
             ApplicationCommandOption(option, state=state) for option in data.get('options', [])
@@ -378,6 +417,9 @@ class ApplicationSlashCommand(ApplicationCommand):
         super().__init__(data, state)
 
     def _from_data(self, data: ApplicationCommandPayload) -> ApplicationCommand:
+        if self._is_current(data):
+            return self
+
         super()._from_data(data)
 
         try:
@@ -398,6 +440,8 @@ class ApplicationUserCommand(ApplicationCommand):
 
     This class is not user constructible, Use :class:`application.UserCommand` instead.
     """
+    __slots__ = ()
+
     def __init__(self, data: ApplicationCommandPayload, state: ConnectionState):
         super().__init__(data, state)
 
@@ -411,6 +455,8 @@ class ApplicationMessageCommand(ApplicationCommand):
 
     This class is not user constructible, Use :class:`application.MessageCommand` instead.
     """
+    __slots__ = ()
+
     def __init__(self, data: ApplicationCommandPayload, state: ConnectionState):
         super().__init__(data, state)
 
@@ -419,23 +465,59 @@ class OptionChoice:
 
     This class can be constructed by users.
 
-    Attributes
+    Parameters
     ----------
     name: :class:`str`
         The name of choice. Will be shown on command explorer.
     value: :class:`str`
         A user-set value of the choice. Will be passed in the command's callback.
     """
+    __slots__ = ('_name', '_value', '_option', '_cached_dict')
 
     def __init__(self, *, name: str, value: Union[str, int, float]):
-        self.name = name
-        self.value = value
+        self._name = name
+        self._value = value
+        self._option: Optional[Option] = None
+        self._cached_dict: Optional[dict] = None
+
+    def _invalidate_cache(self) -> None:
+        self._cached_dict = None
+        if self._option is not None:
+            self._option._invalidate_cache()
+
+    @property
+    def name(self) -> str:
+        """:class:`str`: The name of choice. Will be shown on command explorer."""
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self._invalidate_cache()
+        if self._option is not None:
+            # rebuilding the whole index keeps other choices sharing the old name reachable.
+            self._option._choices_changed()
+
+    @property
+    def value(self) -> Union[str, int, float]:
+        """Union[:class:`str`, :class:`int`, :class:`float`]: A user-set value of the choice.
+        Will be passed in the command's callback.
+        """
+        return self._value
+
+    @value.setter
+    def value(self, value: Union[str, int, float]) -> None:
+        self._value = value
+        self._invalidate_cache()
 
     def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "value": self.value,
-        }
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "name": self._name,
+                "value": self._value,
+            }
+
+        return self._cached_dict.copy()
 
     @classmethod
     def from_dict(cls, dict_):
@@ -478,6 +560,19 @@ class ApplicationCommandOption:
         The minimum value permitted to be supplied if this option is an integer or number.
         ``None`` if there is no limit.
     """
+    __slots__ = (
+        '_state',
+        'name',
+        'description',
+        'type',
+        'required',
+        'choices',
+        'autocomplete',
+        'channel_types',
+        'max_value',
+        'min_value',
+    )
+
     if TYPE_CHECKING:
         name: str
         description: str
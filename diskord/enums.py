@@ -638,6 +638,23 @@ class ApplicationCommandType(Enum, comparable=True):
     slash = 1
 
 
+# channel class name -> channel types shown for an option annotated with it.
+_CHANNEL_CLASS_TYPES: Dict[str, List[Any]] = {
+    "TextChannel": [ChannelType.text, ChannelType.news],
+    "DMChannel": [ChannelType.private],
+    "GroupChannel": [ChannelType.group],
+    "VoiceChannel": [ChannelType.voice],
+    "CategoryChannel": [ChannelType.category],
+    "StoreChannel": [ChannelType.store],
+    "Thread": [
+        ChannelType.news_thread,
+        ChannelType.private_thread,
+        ChannelType.public_thread,
+    ],
+    "StageChannel": [ChannelType.stage_voice],
+}
+
+
 class OptionType(Enum, comparable=True):
     sub_command = 1
     sub_command_group = 2
@@ -665,14 +682,10 @@ class OptionType(Enum, comparable=True):
                     option.converter = type_
                     return cls.string
 
-        if type_ == str:
-            return cls.string
-        elif type_ == int:
-            return cls.integer
-        elif type_ == bool:
-            return cls.boolean
-        elif type_ == float:
-            return cls.number
+        try:
+            return _DATATYPE_OPTION_TYPES[type_]
+        except (KeyError, TypeError):
+            pass
 
         # checking for types from typing
         if get_origin(type_) is Union:
@@ -696,28 +709,19 @@ class OptionType(Enum, comparable=True):
                 # we will do any changes to it and simply return OptionType.channel.
                 return cls.channel
 
-            channel_types_map = {
-                "TextChannel": [ChannelType.text, ChannelType.news],
-                "DMChannel": ChannelType.private,
-                "GroupChannel": ChannelType.group,
-                "VoiceChannel": ChannelType.voice,
-                "CategoryChannel": ChannelType.category,
-                "StoreChannel": ChannelType.store,
-                "Thread": [
-                    ChannelType.news_thread,
-                    ChannelType.private_thread,
-                    ChannelType.public_thread,
-                ],
-                "StageChannel": ChannelType.stage_voice,
-            }
-            unwrap = unwrap_function(option.callback)
-            try:
-                globalns = unwrap.__globals__
-            except AttributeError:
-                globalns = {}
+            channel_types_map = _CHANNEL_CLASS_TYPES
+            # the option decorator already resolved the callback's signature.
+            params = getattr(option.callback, "__application_command_signature__", None)
+            if params is None:
+                unwrap = unwrap_function(option.callback)
+                try:
+                    globalns = unwrap.__globals__
+                except AttributeError:
+                    globalns = {}
 
-            params = get_signature_parameters(option.callback, globalns)
+                params = get_signature_parameters(option.callback, globalns)
             param = params.get(option.arg)
+            channel_types = []
 
             if get_origin(param.annotation) is Union:
                 args = [arg.__name__ for arg in param.annotation.__args__]
@@ -725,23 +729,35 @@ class OptionType(Enum, comparable=True):
                 # now we have the name of all the channel types that were in typing.Union
                 for arg in args:
                     try:
-                        option._channel_types.append(channel_types_map[arg])
+                        channel_types.extend(channel_types_map[arg])
                     except KeyError:
                         # unknown type in typing.Union? ignore it.
                         pass
             else:
                 try:
-                    option._channel_types.append(
+                    channel_types.extend(
                         channel_types_map[param.annotation.__name__]
                     )
                 except KeyError:
                     pass
 
+            if channel_types:
+                option.channel_types.extend(channel_types)
+
             return cls.channel
 
         return cls.string
 
 
+# python types that map directly to an option type.
+_DATATYPE_OPTION_TYPES: Dict[Any, OptionType] = {
+    str: OptionType.string,
+    int: OptionType.integer,
+    bool: OptionType.boolean,
+    float: OptionType.number,
+}
+
+
 class ApplicationCommandPermissionType(Enum, comparable=True):
     role = 1
     user = 2
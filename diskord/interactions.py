@@ -151,6 +151,7 @@ class Interaction:
         "_state",
         "_session",
         "_original_message",
+        "_resolved_target",
         "_cs_response",
         "_cs_followup",
         "_cs_channel",
@@ -160,6 +161,8 @@ class Interaction:
         self._state: ConnectionState = state
         self._session: ClientSession = state.http._HTTPClient__session
         self._original_message: Optional[InteractionMessage] = None
+        # the user or message a context menu command was used on, built lazily.
+        self._resolved_target: Optional[Union[User, Member, Message]] = None
         self._from_data(data)
 
     def _from_data(self, data: InteractionPayload):
@@ -53,7 +53,7 @@ from base64 import b64encode
 from bisect import bisect_left
 import datetime
 import functools
-from inspect import isawaitable as _isawaitable, signature as _signature
+from inspect import isawaitable as _isawaitable, signature as _signature, unwrap as _unwrap
 from operator import attrgetter
 import json
 import re
@@ -1049,9 +1049,13 @@ def format_dt(dt: datetime.datetime, /, style: Optional[TimestampStyle] = None)
 def unwrap_function(function: Callable[..., Any]) -> Callable[..., Any]:
     partial = functools.partial
     while True:
-        if hasattr(function, "__wrapped__"):
-            function = function.__wrapped__
-        elif isinstance(function, partial):
+        try:
+            function = _unwrap(function, stop=lambda f: isinstance(f, partial))
+        except ValueError:
+            # cyclic __wrapped__ chain, return what we have.
+            return function
+
+        if isinstance(function, partial):
             function = function.func
         else:
             return function